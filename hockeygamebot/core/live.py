@@ -64,16 +64,18 @@ def live_loop(livefeed: dict, game: Game):
     for play in all_plays:
         gameevent.event_factory(game=game, play=play, livefeed=livefeed, new_plays=new_plays)
 
-    # Check if any goals were removed
+    # Check if any goals were removed (index the plays once so each goal is a single lookup)
     try:
+        all_plays_by_id = {play["about"]["eventId"]: play for play in all_plays}
         for goal in game.all_goals[:]:
-            was_goal_removed = goal.was_goal_removed(all_plays)
+            was_goal_removed = goal.was_goal_removed(all_plays_by_id)
             if was_goal_removed:
                 pref_team = game.preferred_team.team_name
                 goals_list = game.pref_goals if goal.event_team == pref_team else game.other_goals
 
-                # Remove the Goal from all lists, caches & then finallydelete the object
+                # Remove the Goal from all lists, caches, scoring totals & then finallydelete the object
                 game.all_goals.remove(goal)
+                goal.update_scoring_totals(-1)
                 goals_list.remove(goal)
                 goal.cache.remove(goal)
                 del goal
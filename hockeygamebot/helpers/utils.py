@@ -11,7 +11,6 @@ import shutil
 import time
 from datetime import datetime, timezone
 
-import dateutil.parser
 import requests
 import yaml
 
@@ -43,7 +42,8 @@ def check_social_timeout(func):
 
         try:
             event = kwargs.get("event")
-            event_time = dateutil.parser.parse(event.date_time)
+            # The livefeed dateTime is always ISO-8601 in UTC (fromisoformat doesn't accept "Z" until 3.11)
+            event_time = datetime.fromisoformat(event.date_time.replace("Z", "+00:00"))
             timeout = config["script"]["event_timeout"]
             utcnow = datetime.now(timezone.utc)
             time_since_event = (utcnow - event_time).total_seconds()
@@ -143,6 +143,7 @@ def setup_logging():
     logger.setLevel(logger_level)
 
 
+@functools.lru_cache(maxsize=256)
 def ordinal(n):
     """Converts an integer into its ordinal equivalent.
 
@@ -227,6 +228,79 @@ def clock_emoji(time):
     return clock
 
 
+# Team hashtags (regular season & playoffs) - built once & used by team_hashtag()
+TEAM_HASHTAGS = {
+    "Anaheim Ducks": "#FlyTogether",
+    "Arizona Coyotes": "#Yotes",
+    "Boston Bruins": "#NHLBruins",
+    "Buffalo Sabres": "#LetsGoBuffalo",
+    "Calgary Flames": "#Flames",
+    "Carolina Hurricanes": "#LetsGoCanes",
+    "Chicago Blackhawks": "#Blackhawks",
+    "Colorado Avalanche": "#GoAvsGo",
+    "Columbus Blue Jackets": "#CBJ",
+    "Dallas Stars": "#GoStars",
+    "Detroit Red Wings": "#LGRW",
+    "Edmonton Oilers": "#LetsGoOilers",
+    "Florida Panthers": "#FLAPanthers",
+    "Los Angeles Kings": "#GoKingsGo",
+    "Minnesota Wild": "#MNWild",
+    "Montréal Canadiens": "#GoHabsGo",
+    "Montreal Canadiens": "#GoHabsGo",
+    "Nashville Predators": "#Preds",
+    "New Jersey Devils": "#NJDevils",
+    "New York Islanders": "#Isles",
+    "New York Rangers": "#NYR",
+    "Ottawa Senators": "#GoSensGo",
+    "Philadelphia Flyers": "#AnytimeAnywhere",
+    "Pittsburgh Penguins": "#LetsGoPens",
+    "San Jose Sharks": "#SJSharks",
+    "Seattle Kraken": "#SeaKraken",
+    "St. Louis Blues": "#STLBlues",
+    "Tampa Bay Lightning": "#GoBolts",
+    "Toronto Maple Leafs": "#LeafsForever",
+    "Vancouver Canucks": "#Canucks",
+    "Vegas Golden Knights": "#VegasBorn",
+    "Washington Capitals": "#ALLCAPS",
+    "Winnipeg Jets": "#GoJetsGo",
+}
+
+TEAM_HASHTAGS_PLAYOFFS = {
+    "Anaheim Ducks": "#FlyTogether",
+    "Arizona Coyotes": "#Yotes",
+    "Boston Bruins": "#NHLBruins",
+    "Buffalo Sabres": "#LetsGoBuffalo",
+    "Calgary Flames": "#Flames",
+    "Carolina Hurricanes": "#LetsGoCanes",
+    "Chicago Blackhawks": "#Blackhawks",
+    "Colorado Avalanche": "#GoAvsGo",
+    "Columbus Blue Jackets": "#CBJ",
+    "Dallas Stars": "#GoStars",
+    "Detroit Red Wings": "#LGRW",
+    "Edmonton Oilers": "#LetsGoOilers",
+    "Florida Panthers": "#FLAPanthers",
+    "Los Angeles Kings": "#GoKingsGo",
+    "Minnesota Wild": "#MNWild",
+    "Montréal Canadiens": "#GoHabsGo",
+    "Montreal Canadiens": "#GoHabsGo",
+    "Nashville Predators": "#Preds",
+    "New Jersey Devils": "#NJDevils",
+    "New York Islanders": "#Isles",
+    "New York Rangers": "#PlayLikeANewYorker",
+    "Ottawa Senators": "#GoSensGo",
+    "Philadelphia Flyers": "#AnytimeAnywhere",
+    "Pittsburgh Penguins": "#LetsGoPens",
+    "San Jose Sharks": "#SJSharks",
+    "St. Louis Blues": "#STLBlues",
+    "Tampa Bay Lightning": "#GoBolts",
+    "Toronto Maple Leafs": "#LeafsForever",
+    "Vancouver Canucks": "#Canucks",
+    "Vegas Golden Knights": "#VegasBorn",
+    "Washington Capitals": "#ALLCAPS",
+    "Winnipeg Jets": "#GoJetsGo",
+}
+
+
 def team_hashtag(team, game_type=None):
     """Generates a team hashtag from a team name & game type.
 
@@ -240,83 +314,12 @@ def team_hashtag(team, game_type=None):
         hashtag: team specific hashtag
     """
 
-    team_hashtags = {
-        "Anaheim Ducks": "#FlyTogether",
-        "Arizona Coyotes": "#Yotes",
-        "Boston Bruins": "#NHLBruins",
-        "Buffalo Sabres": "#LetsGoBuffalo",
-        "Calgary Flames": "#Flames",
-        "Carolina Hurricanes": "#LetsGoCanes",
-        "Chicago Blackhawks": "#Blackhawks",
-        "Colorado Avalanche": "#GoAvsGo",
-        "Columbus Blue Jackets": "#CBJ",
-        "Dallas Stars": "#GoStars",
-        "Detroit Red Wings": "#LGRW",
-        "Edmonton Oilers": "#LetsGoOilers",
-        "Florida Panthers": "#FLAPanthers",
-        "Los Angeles Kings": "#GoKingsGo",
-        "Minnesota Wild": "#MNWild",
-        "Montréal Canadiens": "#GoHabsGo",
-        "Montreal Canadiens": "#GoHabsGo",
-        "Nashville Predators": "#Preds",
-        "New Jersey Devils": "#NJDevils",
-        "New York Islanders": "#Isles",
-        "New York Rangers": "#NYR",
-        "Ottawa Senators": "#GoSensGo",
-        "Philadelphia Flyers": "#AnytimeAnywhere",
-        "Pittsburgh Penguins": "#LetsGoPens",
-        "San Jose Sharks": "#SJSharks",
-        "Seattle Kraken": "#SeaKraken",
-        "St. Louis Blues": "#STLBlues",
-        "Tampa Bay Lightning": "#GoBolts",
-        "Toronto Maple Leafs": "#LeafsForever",
-        "Vancouver Canucks": "#Canucks",
-        "Vegas Golden Knights": "#VegasBorn",
-        "Washington Capitals": "#ALLCAPS",
-        "Winnipeg Jets": "#GoJetsGo",
-    }
-
-    team_hashtags_playoffs = {
-        "Anaheim Ducks": "#FlyTogether",
-        "Arizona Coyotes": "#Yotes",
-        "Boston Bruins": "#NHLBruins",
-        "Buffalo Sabres": "#LetsGoBuffalo",
-        "Calgary Flames": "#Flames",
-        "Carolina Hurricanes": "#LetsGoCanes",
-        "Chicago Blackhawks": "#Blackhawks",
-        "Colorado Avalanche": "#GoAvsGo",
-        "Columbus Blue Jackets": "#CBJ",
-        "Dallas Stars": "#GoStars",
-        "Detroit Red Wings": "#LGRW",
-        "Edmonton Oilers": "#LetsGoOilers",
-        "Florida Panthers": "#FLAPanthers",
-        "Los Angeles Kings": "#GoKingsGo",
-        "Minnesota Wild": "#MNWild",
-        "Montréal Canadiens": "#GoHabsGo",
-        "Montreal Canadiens": "#GoHabsGo",
-        "Nashville Predators": "#Preds",
-        "New Jersey Devils": "#NJDevils",
-        "New York Islanders": "#Isles",
-        "New York Rangers": "#PlayLikeANewYorker",
-        "Ottawa Senators": "#GoSensGo",
-        "Philadelphia Flyers": "#AnytimeAnywhere",
-        "Pittsburgh Penguins": "#LetsGoPens",
-        "San Jose Sharks": "#SJSharks",
-        "St. Louis Blues": "#STLBlues",
-        "Tampa Bay Lightning": "#GoBolts",
-        "Toronto Maple Leafs": "#LeafsForever",
-        "Vancouver Canucks": "#Canucks",
-        "Vegas Golden Knights": "#VegasBorn",
-        "Washington Capitals": "#ALLCAPS",
-        "Winnipeg Jets": "#GoJetsGo",
-    }
-
     # if GameType(game_type) == GameType.PLAYOFFS:
-    #     return team_hashtags_playoffs[team]
+    #     return TEAM_HASHTAGS_PLAYOFFS[team]
     # else:
-    #     return team_hashtags[team]
+    #     return TEAM_HASHTAGS[team]
 
-    return team_hashtags.get(team)
+    return TEAM_HASHTAGS.get(team)
 
 
 def calculate_shot_distance(x: int, y: int) -> str:
@@ -3,6 +3,7 @@ This module contains the Class definition for the single Game object created dur
 """
 
 import logging
+from collections import defaultdict
 from datetime import datetime
 
 import dateutil.tz
@@ -62,6 +63,10 @@ class Game:
             self.preferred_team = away
             self.other_team = home
 
+        # The home / away keys are fixed for the game, store them for livefeed lookups
+        self.preferred_homeaway = self.preferred_team.home_away
+        self.other_homeaway = self.other_team.home_away
+
         self.tz_id = dateutil.tz.gettz(self.preferred_team.tz_id)
         self.tz_offset = self.tz_id.utcoffset(datetime.now(self.tz_id))
         self.past_start_time = False
@@ -79,7 +84,11 @@ class Game:
         self.pref_goals = []
         self.other_goals = []
         self.all_goals = []
+        self.scoring_totals = defaultdict(lambda: {"goals": 0, "assists": 0, "points": 0})
+        self.penalty_totals = defaultdict(int)
         self.live_loop_counter = 0
+        self.content_milestones = None
+        self.content_milestones_loop = None
 
         # Initialize Pregame Tweets dictionary
         self.pregame_lasttweet = None
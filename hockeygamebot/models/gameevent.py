@@ -2,9 +2,11 @@
 This module contains object creation for all Game Events.
 """
 
+import functools
 import logging
 import os
 import traceback
+from collections import defaultdict
 
 from hockeygamebot.definitions import IMAGES_PATH
 from hockeygamebot.helpers import utils
@@ -14,11 +16,93 @@ from hockeygamebot.nhlapi import contentfeed, stats
 from hockeygamebot.social import socialhandler
 from hockeygamebot.core import images
 
+# Maps a player's position type to its index in the (forwards, defense, goalies) lineup buckets
+_POSITION_BUCKETS = {"Forward": 0, "Defenseman": 1, "Goalie": 2}
+
+# Career stat attributes checked for milestones after a goal - (total attr, name attr, log label, type)
+_CAREER_MILESTONES = (
+    ("scorer_career_points", "scorer_name", "Goal Scorer", "point"),
+    ("primary_career_assists", "primary_name", "Primary", "assist"),
+    ("primary_career_points", "primary_name", "Primary", "point"),
+    ("secondary_career_assists", "secondary_name", "Secondary", "assist"),
+    ("secondary_career_points", "secondary_name", "Secondary", "point"),
+)
+
+# Shot event types that count towards Corsi & Fenwick
+_CORSI_EVENTS = frozenset(("MISSED_SHOT", "BLOCKED_SHOT", "SHOT"))
+_FENWICK_EVENTS = frozenset(("MISSED_SHOT", "SHOT"))
+
+# Penalty skater text keyed by (strength, preferred skaters, other skaters) - strength is "Even" or "PP"
+_PENALTY_SKATERS_TEXT = {
+    ("Even", 4, 4): "Teams will skate 4 on 4.",
+    ("Even", 3, 3): "Teams will skate 3 on 3.",
+    # Preferred Team Advantages
+    ("PP", 5, 4): "{pref_short_name} are headed to the power play!",
+    ("PP", 5, 3): "{pref_short_name} will have a two-man advantage!",
+    ("PP", 4, 3): "{pref_short_name} are headed a 4-on-3 power play!",
+    # Other Team Advantages
+    ("PP", 4, 5): "{pref_short_name} are headed to the penalty kill!",
+    ("PP", 3, 5): "{pref_short_name} will have to kill off a two-man advantage!",
+    ("PP", 3, 4): "{pref_short_name} will have a 4-on-3 penalty to kill!",
+}
+
+# Shootout period events that aren't actual shootout attempts (skipped by ShootoutEvent)
+_NON_SHOOTOUT_EVENTS = frozenset(
+    ("PERIOD_START", "SHOOTOUT_COMPLETE", "PERIOD_END", "PERIOD_OFFICIAL", "GAME_OFFICIAL")
+)
+
+# Converts some poorly named penalty (secondary) types
+_PENALTY_TYPE_FIXES = {
+    "delaying game - puck over glass": "delay of game (puck over glass)",
+    "interference - goalkeeper": "goalie interference",
+    "missing key [pd_151]": "delay of game (unsuccessful challenge)",
+    "hi-sticking": "high sticking",
+}
+
+
+def group_players_by_type(players: list) -> dict:
+    """Groups the players section of an event by (lowercased) playerType in a single pass
+        instead of re-scanning the players list once per player type.
 
+    Args:
+        players (list): The players section of an event in the livefeed response
+
+    Returns:
+        dict: Lists of players keyed by playerType (missing types return an empty list)
+    """
+
+    players_by_type = defaultdict(list)
+    for player in players:
+        players_by_type[player.get("playerType").lower()].append(player)
+
+    return players_by_type
+
+
+def get_shot_hit(description: str):
+    """Checks a shot description to determine if the shot hit the crossbar or the post.
+        The description is lowercased once & each keyword is only searched for once.
+
+    Args:
+        description (str): The event description in the livefeed response
+
+    Returns:
+        str: "crossbar", "post" or None if the shot hit neither
+    """
+
+    description = (description or "").lower()
+    if "crossbar" in description:
+        return "crossbar"
+    if "goalpost" in description:
+        return "post"
+    return None
+
+
+@functools.lru_cache(maxsize=128)
 def event_mapper(event: str, event_type: str) -> object:
     """A function that maps events or event types to a GameEvent class. This is needed because
         the NHL keeps changing these fields and its easier to have one place to manage this mapping.
         We also take event & eventTypeId so we have something to fall back on.
+        Cached since there are only a handful of (event, eventTypeId) pairs in a game.
 
     Args:
         event (str): The event in the livefeed response
@@ -118,19 +202,28 @@ def event_factory(game: Game, play: dict, livefeed: dict, new_plays: bool):
         Type-Specific Event
     """
 
-    event_type = play.get("result").get("eventTypeId")
-    event = play.get("result").get("event")
+    about = play.get("about")
+    event_id = about.get("eventId")
+    event_idx = about.get("eventIdx")
+
+    result = play.get("result")
+    event_type = result.get("eventTypeId")
+    event = result.get("event")
     object_type = event_mapper(event=event, event_type=event_type)
-    event_id = play.get("about").get("eventId")
-    event_idx = play.get("about").get("eventIdx")
 
     # Check whether this is a shootout event & re-assigned the object_type accordingly
-    shootout = bool(play.get("about").get("periodType") == "SHOOTOUT" and object_type != GameEndEvent)
-    object_type = ShootoutEvent if shootout else object_type
+    if about.get("periodType") == "SHOOTOUT" and object_type is not GameEndEvent:
+        object_type = ShootoutEvent
 
     # Check whether this event is in our Cache
     obj = object_type.cache.get(event_id)
 
+    # Most plays on each poll have already been created - return those without any further work.
+    # GoalEvents still need the full path when there are no new plays (scoring changes & content).
+    if obj is not None and (object_type is not GoalEvent or new_plays):
+        game.last_event_idx = event_idx
+        return obj
+
     # Add the game object & livefeed to our response
     # event["game"] = game
     play["livefeed"] = livefeed
@@ -147,16 +240,22 @@ def event_factory(game: Game, play: dict, livefeed: dict, new_plays: bool):
             )
             obj.tweet = social_ids.get("twitter")
 
+            obj.scoring_change_sent()
+
         # Content Feed Checks
         # all_goals_have_content = all(goal.video_url is not None for idx, goal in GoalEvent.cache.entries.items())
-        should_check_content = True if game.live_loop_counter % 10 == 0 else False
+        should_check_content = game.live_loop_counter % 10 == 0
 
         # If the object has no video_url, all goals don't have content and we should be checking content (via counter)
         if not obj.video_url and should_check_content:
             logging.info("A Goal without a video has been found - check the content feed for it.")
-            milestones = contentfeed.get_content_feed(game_id=game.game_id, milestones=True)
+            # Every goal checked during this loop shares a single content feed request
+            if game.content_milestones_loop != game.live_loop_counter:
+                milestones = contentfeed.get_content_feed(game_id=game.game_id, milestones=True)
+                game.content_milestones = contentfeed.index_milestones(milestones)
+                game.content_milestones_loop = game.live_loop_counter
             content_exists, highlight, video_url, mp4_url = contentfeed.search_milestones_for_id(
-                milestones, event_id
+                game.content_milestones, event_id
             )
             if content_exists:
                 # blurb = highlight.get('blurb')
@@ -193,49 +292,6 @@ def event_factory(game: Game, play: dict, livefeed: dict, new_plays: bool):
     return obj
 
 
-def game_event_total(object_type: object, player: str, attribute: str):
-    """Calculates the number of events a person has for a single game.
-        Mostly used for penalties and goals (hat trick, etc).
-
-    Args:
-        object_type: the type of object to help determine the cache
-        player: player name to filter on
-        attribute: attribute to match on
-
-    Return:
-        event_count: number of events
-    """
-
-    items = object_type.cache.entries.items()
-    events = [getattr(v, attribute) for k, v in items if getattr(v, attribute) == player]
-    return len(events)
-
-
-def game_scoring_totals(player: str):
-    """Calculates the number of goals, assists, points a person has for a single game.
-
-    Args:
-        player: player name to filter on
-
-    Return:
-        event_count: dictionary of event counts
-    """
-
-    items = GoalEvent.cache.entries.items()
-
-    goals = len([getattr(v, "scorer_name") for k, v in items if getattr(v, "scorer_name") == player])
-    primary = len([getattr(v, "primary_name") for k, v in items if getattr(v, "primary_name") == player])
-    secondary = len(
-        [getattr(v, "secondary_name") for k, v in items if getattr(v, "secondary_name") == player]
-    )
-
-    assists = primary + secondary
-    points = goals + assists
-
-    game_totals = {"goals": goals, "assists": assists, "points": points}
-    return game_totals
-
-
 class Cache:
     """ A cache that holds GameEvents by type. """
 
@@ -254,8 +310,8 @@ class Cache:
         return entry
 
     def remove(self, entry: object):
-        """ Removes an entry from its Object cache. """
-        del self.entries[entry.event_id]
+        """ Removes an entry from its Object cache (no-op if it was already removed). """
+        self.entries.pop(entry.event_id, None)
 
 
 class GenericEvent:
@@ -293,10 +349,11 @@ class GenericEvent:
         self.period_time_remain_ss = utils.from_mmss(self.period_time_remain)
         # self.date_time = dateutil.parser.parse(about.get("dateTime"))
         self.date_time = about.get("dateTime")
-        self.away_goals = about.get("goals").get("away")
-        self.home_goals = about.get("goals").get("home")
-        self.pref_goals = about.get("goals").get(self.game.preferred_team.home_away)
-        self.other_goals = about.get("goals").get(self.game.other_team.home_away)
+        goals = about.get("goals")
+        self.away_goals = goals.get("away")
+        self.home_goals = goals.get("home")
+        self.pref_goals = goals.get(self.game.preferred_homeaway)
+        self.other_goals = goals.get(self.game.other_homeaway)
 
         # Get On-Ice Players
         boxscore = self.livefeed.get("liveData").get("boxscore")
@@ -316,14 +373,11 @@ class GenericEvent:
         Returns:
             Dictionary representation of object
         """
-        # Generate the full dictionary
-        dict_obj = self.__dict__
-
-        # Copy the dictionary & pop the data key if needed
-        dict_obj_nosource = dict(dict_obj)
-        dict_obj_nosource.pop("data")
+        # Return the full dictionary or only copy it when the data key needs excluding
+        if withsource:
+            return self.__dict__
 
-        return dict_obj if withsource else dict_obj_nosource
+        return {k: v for k, v in self.__dict__.items() if k != "data"}
 
 
 class PeriodReadyEvent(GenericEvent):
@@ -343,7 +397,7 @@ class PeriodReadyEvent(GenericEvent):
 
     def generate_social_msg(self):
         """ Used for generating the message that will be logged or sent to social media. """
-        preferred_homeaway = self.game.preferred_team.home_away
+        preferred_homeaway = self.game.preferred_homeaway
         players = self.livefeed.get("gameData").get("players")
         on_ice = (
             self.livefeed.get("liveData").get("boxscore").get("teams").get(preferred_homeaway).get("onIce")
@@ -362,23 +416,18 @@ class PeriodReadyEvent(GenericEvent):
 
         logging.info("On Ice Players - %s", on_ice)
 
-        forwards = []
-        defense = []
-        goalies = []
+        buckets = ([], [], [])
 
         for player in on_ice:
-            key_id = "ID{}".format(player)
+            key_id = f"ID{player}"
             player_obj = players[key_id]
             logging.debug("Getting information for %s -- %s", key_id, player_obj)
 
-            player_last_name = player_obj["lastName"]
-            player_type = player_obj["primaryPosition"]["type"]
-            if player_type == "Forward":
-                forwards.append(player_last_name)
-            elif player_type == "Defenseman":
-                defense.append(player_last_name)
-            elif player_type == "Goalie":
-                goalies.append(player_last_name)
+            bucket_idx = _POSITION_BUCKETS.get(player_obj["primaryPosition"]["type"])
+            if bucket_idx is not None:
+                buckets[bucket_idx].append(player_obj["lastName"])
+
+        forwards, defense, goalies = buckets
 
         # Get Linenup for Periods 1-3 (applies to all games)
         if self.period <= 3:
@@ -396,14 +445,14 @@ class PeriodReadyEvent(GenericEvent):
         elif self.period == 4 and self.game.game_type in ("PR", "R"):
             all_players = forwards + defense
             text_players = " - ".join(all_players)
-            try:
+            if goalies:
                 text_goalie = goalies[0]
                 social_msg = (
                     f"On the ice to start overtime for your "
                     f"{self.game.preferred_team.team_name} "
                     f"are:\n\n{text_players} & {text_goalie}."
                 )
-            except IndexError:
+            else:
                 # If for some reason a goalie isn't detected on ice
                 social_msg = (
                     f"On the ice to start overtime for your "
@@ -415,7 +464,7 @@ class PeriodReadyEvent(GenericEvent):
             ot_number = self.period - 3
             text_forwards = "-".join(forwards)
             text_defense = "-".join(defense)
-            text_goalie = goalies[0]
+            text_goalie = goalies[0] if goalies else ""
 
             social_msg = (
                 f"On the ice to start OT{ot_number} for your "
@@ -528,24 +577,22 @@ class PeriodEndEvent(GenericEvent):
                 f"are headed to overtime tied at {self.pref_goals}!"
             )
 
-        # Non-Playoff game tied after OT - Heads to a Shootout
-        elif self.period > 3 and self.tied_score and GameType(self.game.game_type) != GameType.PLAYOFFS:
-            period_end_text = (
-                f"60 minutes and some overtime weren't enough to decide this game. "
-                f"{self.game.preferred_team.short_name} and {self.game.other_team.short_name} "
-                f"are headed to a shootout!"
-            )
-
-        # Playoff game still tied - heads to extra OT!
-        elif self.period > 3 and self.tied_score and GameType(self.game.game_type) == GameType.PLAYOFFS:
-            ot_period = self.period - 3
-            next_ot_period = ot_period + 1
-            ot_text = "overtime wasn't" if ot_period == 1 else "overtimes weren't"
-            period_end_text = (
-                f"{ot_period} {ot_text} to decide this game. "
-                f"{self.game.preferred_team.short_name} and {self.game.other_team.short_name} "
-                f"headed to OT{next_ot_period} tied at {self.pref_goals}!"
-            )
+        # Game still tied after OT - (non-playoff) heads to a shootout or (playoff) heads to extra OT!
+        elif self.period > 3 and self.tied_score:
+            teams_text = f"{self.game.preferred_team.short_name} and {self.game.other_team.short_name}"
+            if GameType(self.game.game_type) != GameType.PLAYOFFS:
+                period_end_text = (
+                    f"60 minutes and some overtime weren't enough to decide this game. "
+                    f"{teams_text} are headed to a shootout!"
+                )
+            else:
+                ot_period = self.period - 3
+                next_ot_period = ot_period + 1
+                ot_text = "overtime wasn't" if ot_period == 1 else "overtimes weren't"
+                period_end_text = (
+                    f"{ot_period} {ot_text} to decide this game. "
+                    f"{teams_text} headed to OT{next_ot_period} tied at {self.pref_goals}!"
+                )
 
         else:
             period_end_text = None
@@ -632,12 +679,12 @@ class PeriodEndEvent(GenericEvent):
         # Create a list of stats to check (converts dict keys into iterable list)
         stats_to_check = [k for k in stat_leaders if "_" not in k]
 
-        preferred_homeaway = self.game.preferred_team.home_away
+        preferred_homeaway = self.game.preferred_homeaway
         player_stats = (
             self.livefeed.get("liveData").get("boxscore").get("teams").get(preferred_homeaway).get("players")
         )
 
-        for _, player in player_stats.items():
+        for player in player_stats.values():
             name = player.get("person").get("fullName")
             last_name = " ".join(name.split()[1:])
             stats = player.get("stats").get("skaterStats")
@@ -672,13 +719,13 @@ class FaceoffEvent(GenericEvent):
         super().__init__(data, game)
 
         # Get the Players Section
-        players = data.get("players")
-        winner = [x for x in players if x.get("playerType").lower() == "winner"]
-        loser = [x for x in players if x.get("playerType").lower() == "loser"]
-        self.winner_name = winner[0].get("player").get("fullName")
-        self.winner_id = winner[0].get("player").get("id")
-        self.loser_name = loser[0].get("player").get("fullName")
-        self.loser_id = loser[0].get("player").get("id")
+        players = group_players_by_type(data.get("players"))
+        winner_player = players["winner"][0].get("player")
+        loser_player = players["loser"][0].get("player")
+        self.winner_name = winner_player.get("fullName")
+        self.winner_id = winner_player.get("id")
+        self.loser_name = loser_player.get("fullName")
+        self.loser_id = loser_player.get("id")
 
         # Get the Coordinates Section
         coordinates = data.get("coordinates")
@@ -712,13 +759,13 @@ class HitEvent(GenericEvent):
         super().__init__(data, game)
 
         # Get the Players Section
-        players = data.get("players")
-        hitter = [x for x in players if x.get("playerType").lower() == "hitter"]
-        hittee = [x for x in players if x.get("playerType").lower() == "hittee"]
-        self.hitter_name = hitter[0].get("player").get("fullName")
-        self.hitter_id = hitter[0].get("player").get("id")
-        self.hittee_id = hittee[0].get("player").get("fullName")
-        self.hittee_id = hittee[0].get("player").get("id")
+        players = group_players_by_type(data.get("players"))
+        hitter_player = players["hitter"][0].get("player")
+        hittee_player = players["hittee"][0].get("player")
+        self.hitter_name = hitter_player.get("fullName")
+        self.hitter_id = hitter_player.get("id")
+        self.hittee_name = hittee_player.get("fullName")
+        self.hittee_id = hittee_player.get("id")
 
         # Get the Coordinates Section
         coordinates = data.get("coordinates")
@@ -751,8 +798,9 @@ class GoalEvent(GenericEvent):
         # Goals have a few extra results attributes
         results = data.get("result")
         self.secondary_type = results.get("secondaryType", "shot").lower()
-        self.strength_code = results.get("strength").get("code")
-        self.strength_name = results.get("strength").get("name")
+        strength = results.get("strength")
+        self.strength_code = strength.get("code")
+        self.strength_name = strength.get("name")
         self.game_winning_goal = results.get("gameWinningGoal")
         self.empty_net = results.get("emptyNet")
         self.event_team = data.get("team").get("name")
@@ -770,35 +818,40 @@ class GoalEvent(GenericEvent):
         self.y = coordinates.get("y", 0.0)
         self.goal_distnace = utils.calculate_shot_distance(self.x, self.y)
 
-        # Get the Players Section
-        players = data.get("players")
-        scorer = [x for x in players if x.get("playerType").lower() == "scorer"]
-        assist = [x for x in players if x.get("playerType").lower() == "assist"]
-        goalie = [x for x in players if x.get("playerType").lower() == "goalie"]
+        # Get the Players Section (raw section is kept to short-circuit scoring change checks)
+        self.players_data = data.get("players")
+        self.pending_scoring_change = None
+        players = group_players_by_type(self.players_data)
+        scorer = players["scorer"]
+        assist = players["assist"]
+        goalie = players["goalie"]
 
         # Handle Scorer name, id & totals
-        self.scorer_name = scorer[0].get("player").get("fullName")
-        self.scorer_id = scorer[0].get("player").get("id")
-        self.scorer_game_total = game_scoring_totals(self.scorer_name)["goals"] + 1
+        scorer_player = scorer[0].get("player")
+        self.scorer_name = scorer_player.get("fullName")
+        self.scorer_id = scorer_player.get("id")
+        scorer_game_stats = self.game.scoring_totals[self.scorer_name]
+        self.scorer_game_total = scorer_game_stats["goals"] + 1
         self.scorer_game_total_ordinal = utils.ordinal(self.scorer_game_total)
-        self.scorer_game_total_points = game_scoring_totals(self.scorer_name)["points"] + 1
+        self.scorer_game_total_points = scorer_game_stats["points"] + 1
         self.scorer_game_total_point_ordinal = utils.ordinal(self.scorer_game_total_points)
         self.scorer_season_ttl = scorer[0].get("seasonTotal")
 
-        # Get Scorer Career Stats
-        self.scorer_career_stats = stats.get_player_career_stats(self.scorer_id)
+        # Get Scorer Career Stats (assists are fetched at the same time & served from cache in parse_assists)
+        player_ids = [self.scorer_id] + [x.get("player").get("id") for x in assist]
+        self.scorer_career_stats = stats.get_career_stats_batch(player_ids)[self.scorer_id]
         self.scorer_career_goals = self.scorer_career_stats.get("goals", 0) + self.scorer_game_total
         self.scorer_career_points = self.scorer_career_stats.get("points", 0) + self.scorer_game_total_points
-        print("==================== POINT TOALS SECTION ====================")
-        print(f"Goal Scorer ({self.scorer_name}) Goals - {self.scorer_game_total}")
-        print(f"Goal Scorer ({self.scorer_name}) Career Goals - {self.scorer_career_goals}")
-        print(f"Goal Scorer ({self.scorer_name}) Points - {self.scorer_game_total_points}")
-        print(f"Goal Scorer ({self.scorer_name}) Career Points - {self.scorer_career_points}")
+        logging.debug("Goal Scorer (%s) Goals - %s", self.scorer_name, self.scorer_game_total)
+        logging.debug("Goal Scorer (%s) Career Goals - %s", self.scorer_name, self.scorer_career_goals)
+        logging.debug("Goal Scorer (%s) Points - %s", self.scorer_name, self.scorer_game_total_points)
+        logging.debug("Goal Scorer (%s) Career Points - %s", self.scorer_name, self.scorer_career_points)
 
         # Goalie isn't recorded for empty net goals
         try:
-            self.goalie_name = goalie[0].get("player").get("fullName")
-            self.goalie_id = goalie[0].get("player").get("id")
+            goalie_player = goalie[0].get("player")
+            self.goalie_name = goalie_player.get("fullName")
+            self.goalie_id = goalie_player.get("id")
         except IndexError as e:
             logging.warning("No goalie was recorded - not needed so just setting to None. %s", e)
             self.goalie_name = None
@@ -807,15 +860,6 @@ class GoalEvent(GenericEvent):
         # Assist parsing is contained within a function
         self.parse_assists(assist=assist)
 
-        # Add this event to the goals list in the game
-        goals_list = (
-            self.game.pref_goals
-            if self.event_team == self.game.preferred_team.team_name
-            else self.game.other_goals
-        )
-        goals_list.append(self)
-        self.game.all_goals.append(self)
-
         # Now call any functions that should be called when creating a new object
         self.goal_title_text = self.get_goal_title_text()
         self.goal_main_text = self.get_goal_main_text()
@@ -825,59 +869,47 @@ class GoalEvent(GenericEvent):
             f"{game.other_team.short_name}: {game.other_team.score}"
         )
 
-        # Generate the Discord Embed
-        self.discord_embed = self.generate_discord_embed()
+        # Generate the Discord Embed (only if Discord is enabled & not kept on the event once sent)
+        discord_embed = self.generate_discord_embed() if socialhandler.discord_enabled() else None
         social_ids = socialhandler.send(
-            msg=self.social_msg, event=self, game_hashtag=True, discord_embed=self.discord_embed
+            msg=self.social_msg, event=self, game_hashtag=True, discord_embed=discord_embed
         )
 
         # Set any social media IDs
         self.tweet = social_ids.get("twitter")
 
         # Now that the main goal text is sent, check for milestones
-        if hasattr(self, "scorer_career_points") and (
-            self.scorer_career_points % 100 == 0 or self.scorer_career_points == 1
-        ):
-            logging.info("Goal Scorer - Career Point Milestone - %s", self.scorer_career_points)
-            self.milestone_tweet_sender(self.scorer_name, "point", self.scorer_career_points)
-
-        if hasattr(self, "primary_career_assists") and (
-            self.primary_career_assists % 100 == 0 or self.primary_career_assists == 1
-        ):
-            logging.info("Primary - Career Assist Milestone - %s", self.primary_career_assists)
-            self.milestone_tweet_sender(self.primary_name, "assist", self.primary_career_assists)
-
-        if hasattr(self, "primary_career_points") and (
-            self.primary_career_points % 100 == 0 or self.primary_career_points == 1
-        ):
-            logging.info("Primary - Career Point Milestone - %s", self.scorer_career_points)
-            self.milestone_tweet_sender(self.primary_name, "point", self.primary_career_points)
-
-        if hasattr(self, "secondary_career_assists") and (
-            self.secondary_career_assists % 100 == 0 or self.secondary_career_assists == 1
-        ):
-            logging.info("Secondary - Career Assist Milestone - %s", self.secondary_career_assists)
-            self.milestone_tweet_sender(self.secondary_name, "assist", self.secondary_career_assists)
-
-        if hasattr(self, "secondary_career_points") and (
-            self.secondary_career_points % 100 == 0 or self.secondary_career_points == 1
-        ):
-            logging.info("Secondary - Career Point Milestone - %s", self.secondary_career_points)
-            self.milestone_tweet_sender(self.secondary_name, "point", self.secondary_career_points)
+        for career_attr, name_attr, label, milestone_type in _CAREER_MILESTONES:
+            career_total = getattr(self, career_attr, None)
+            if career_total is not None and (career_total % 100 == 0 or career_total == 1):
+                logging.info("%s - Career %s Milestone - %s", label, milestone_type.title(), career_total)
+                self.milestone_tweet_sender(getattr(self, name_attr), milestone_type, career_total)
+
+        # Only track & count this goal once it has been fully created (failed goals are retried)
+        goals_list = (
+            self.game.pref_goals
+            if self.event_team == self.game.preferred_team.team_name
+            else self.game.other_goals
+        )
+        goals_list.append(self)
+        self.game.all_goals.append(self)
+        self.update_scoring_totals()
 
     def parse_assists(self, assist: list):
         """ Since we have to parse assists initially & for scoring changes, move this to a function. """
 
         self.assists = assist
+        self.assist_ids = tuple(x.get("player").get("id") for x in assist)
         self.num_assists = len(assist)
 
         if len(assist) == 2:
-            self.primary_name = assist[0].get("player").get("fullName")
-            self.primary_id = assist[0].get("player").get("id")
+            primary_player = assist[0].get("player")
+            self.primary_name = primary_player.get("fullName")
+            self.primary_id = primary_player.get("id")
             self.primary_season_ttl = assist[0].get("seasonTotal")
 
             # Get Primary Game & Career Stats
-            self.primary_game_stats = game_scoring_totals(self.primary_name)
+            self.primary_game_stats = dict(self.game.scoring_totals[self.primary_name])
             self.primary_game_assists = self.primary_game_stats["assists"] + 1
             self.primary_game_points = self.primary_game_stats["points"] + 1
             self.primary_career_stats = stats.get_player_career_stats(self.primary_id)
@@ -885,17 +917,22 @@ class GoalEvent(GenericEvent):
                 self.primary_career_stats.get("assists", 0) + self.primary_game_assists
             )
             self.primary_career_points = self.primary_career_stats.get("points", 0) + self.primary_game_points
-            print(f"Primary Assist ({self.primary_name}) Assists - {self.primary_game_assists}")
-            print(f"Primary Assist ({self.primary_name}) Career Assists - {self.primary_career_assists}")
-            print(f"Primary Assist ({self.primary_name}) Points - {self.primary_game_points}")
-            print(f"Primary Assist ({self.primary_name}) Career Points - {self.primary_career_points}")
+            logging.debug("Primary Assist (%s) Assists - %s", self.primary_name, self.primary_game_assists)
+            logging.debug(
+                "Primary Assist (%s) Career Assists - %s", self.primary_name, self.primary_career_assists
+            )
+            logging.debug("Primary Assist (%s) Points - %s", self.primary_name, self.primary_game_points)
+            logging.debug(
+                "Primary Assist (%s) Career Points - %s", self.primary_name, self.primary_career_points
+            )
 
-            self.secondary_name = assist[1].get("player").get("fullName")
-            self.secondary_id = assist[1].get("player").get("id")
+            secondary_player = assist[1].get("player")
+            self.secondary_name = secondary_player.get("fullName")
+            self.secondary_id = secondary_player.get("id")
             self.secondary_season_ttl = assist[1].get("seasonTotal")
 
             # Get Secondary Game & Career Stats
-            self.secondary_game_stats = game_scoring_totals(self.secondary_name)
+            self.secondary_game_stats = dict(self.game.scoring_totals[self.secondary_name])
             self.secondary_game_assists = self.secondary_game_stats["assists"] + 1
             self.secondary_game_points = self.secondary_game_stats["points"] + 1
             self.secondary_career_stats = stats.get_player_career_stats(self.secondary_id)
@@ -905,30 +942,43 @@ class GoalEvent(GenericEvent):
             self.secondary_career_points = (
                 self.secondary_career_stats.get("points", 0) + self.secondary_game_points
             )
-            print(f"Secondary Assist ({self.secondary_name}) Assists - {self.secondary_game_assists}")
-            print(
-                f"Secondary Assist ({self.secondary_name}) Career Assists - {self.secondary_career_assists}"
+            logging.debug(
+                "Secondary Assist (%s) Assists - %s", self.secondary_name, self.secondary_game_assists
+            )
+            logging.debug(
+                "Secondary Assist (%s) Career Assists - %s",
+                self.secondary_name,
+                self.secondary_career_assists,
+            )
+            logging.debug(
+                "Secondary Assist (%s) Points - %s", self.secondary_name, self.secondary_game_points
+            )
+            logging.debug(
+                "Secondary Assist (%s) Career Points - %s", self.secondary_name, self.secondary_career_points
             )
-            print(f"Secondary Assist ({self.secondary_name}) Points - {self.secondary_game_points}")
-            print(f"Secondary Assist ({self.secondary_name}) Career Points - {self.secondary_career_points}")
 
             self.unassisted = False
         elif len(assist) == 1:
-            self.primary_name = assist[0].get("player").get("fullName")
-            self.primary_id = assist[0].get("player").get("id")
+            primary_player = assist[0].get("player")
+            self.primary_name = primary_player.get("fullName")
+            self.primary_id = primary_player.get("id")
             self.primary_season_ttl = assist[0].get("seasonTotal")
 
             # Get Primary Game & Career Stats
-            self.primary_game_stats = game_scoring_totals(self.primary_name)
+            self.primary_game_stats = dict(self.game.scoring_totals[self.primary_name])
             self.primary_game_assists = self.primary_game_stats["assists"] + 1
             self.primary_game_points = self.primary_game_stats["points"] + 1
             self.primary_career_stats = stats.get_player_career_stats(self.primary_id)
             self.primary_career_assists = self.primary_career_stats["assists"] + self.primary_game_assists
             self.primary_career_points = self.primary_career_stats["points"] + self.primary_game_points
-            print(f"Primary Assist ({self.primary_name}) Assists - {self.primary_game_assists}")
-            print(f"Primary Assist ({self.primary_name}) Career Assists - {self.primary_career_assists}")
-            print(f"Primary Assist ({self.primary_name}) Points - {self.primary_game_points}")
-            print(f"Primary Assist ({self.primary_name}) Career Points - {self.primary_career_points}")
+            logging.debug("Primary Assist (%s) Assists - %s", self.primary_name, self.primary_game_assists)
+            logging.debug(
+                "Primary Assist (%s) Career Assists - %s", self.primary_name, self.primary_career_assists
+            )
+            logging.debug("Primary Assist (%s) Points - %s", self.primary_name, self.primary_game_points)
+            logging.debug(
+                "Primary Assist (%s) Career Points - %s", self.primary_name, self.primary_career_points
+            )
 
             self.secondary_name = None
             self.secondry_id = None
@@ -944,6 +994,17 @@ class GoalEvent(GenericEvent):
             self.secondary_season_ttl = None
             self.unassisted = True
 
+    def update_scoring_totals(self, count: int = 1):
+        """Adds this goal's scorer & assists to the game scoring totals (or removes them with count=-1)."""
+        scoring_totals = self.game.scoring_totals
+        scoring_totals[self.scorer_name]["goals"] += count
+        scoring_totals[self.scorer_name]["points"] += count
+
+        for assist_name in (self.primary_name, self.secondary_name):
+            if assist_name is not None:
+                scoring_totals[assist_name]["assists"] += count
+                scoring_totals[assist_name]["points"] += count
+
     def get_goal_title_text(self):
         """ Gets the main goal text / header. """
 
@@ -976,7 +1037,7 @@ class GoalEvent(GenericEvent):
         goal_title_text = f"{goal_milestone_text}{goal_title_text} {goal_emoji}"
         return goal_title_text
 
-    def get_goal_main_text(self, discordfmt=False):
+    def get_goal_main_text(self):
         """ Gets the main goal description (players, shots, etc). """
         # TODO: Add randomness to this section of code.
 
@@ -991,64 +1052,50 @@ class GoalEvent(GenericEvent):
             goal_count_text = None
 
         # Main goal scorere text (per season, shot type, etc)
+        period_text = "overtime" if self.period_type == "OVERTIME" else f"the {self.period_ordinal} period"
+        time_left_text = f"with {self.period_time_remain_str} left in {period_text}."
         if self.secondary_type == "deflected":
             goal_scoring_text = (
                 f"{self.scorer_name} ({self.scorer_season_ttl}) deflects a shot past "
-                f"{self.goalie_name} with {self.period_time_remain_str} left "
-                f"in the {self.period_ordinal} period."
+                f"{self.goalie_name} {time_left_text}"
             )
         else:
             goal_scoring_text = (
                 f"{self.scorer_name} ({self.scorer_season_ttl}) scores on a "
-                f"{self.secondary_type} from {self.goal_distnace} away with "
-                f"{self.period_time_remain_str} left in the "
-                f"{self.period_ordinal} period."
+                f"{self.secondary_type} from {self.goal_distnace} away {time_left_text}"
             )
 
         # Assists Section
         if self.num_assists == 1:
             goal_assist_text = f"🍎 {self.primary_name} ({self.primary_season_ttl})"
-            goal_assist_discord = f"🍎 {self.primary_name} ({self.primary_season_ttl})"
         elif self.num_assists == 2:
             goal_assist_text = (
                 f"🍎 {self.primary_name} ({self.primary_season_ttl})\n"
                 f"🍏 {self.secondary_name} ({self.secondary_season_ttl})"
             )
-            goal_assist_discord = (
-                f"🍎 {self.primary_name} ({self.primary_season_ttl})\n"
-                f"🍏 {self.secondary_name} ({self.secondary_season_ttl})"
-            )
         else:
             goal_assist_text = None
-            goal_assist_discord = None
-
-        # FIXME: Can I fix this weird if / else - come back to it.
-        if goal_count_text is None and goal_assist_text is None:
-            goal_main_text = goal_scoring_text
-            goal_main_discord = goal_scoring_text
-        elif goal_count_text is None:
-            goal_main_text = f"{goal_scoring_text}\n\n{goal_assist_text}"
-            goal_main_discord = f"{goal_scoring_text}\n\n{goal_assist_discord}"
-        elif goal_assist_text is None:
-            goal_main_text = f"{goal_count_text} {goal_scoring_text}"
-            goal_main_discord = f"{goal_count_text} {goal_scoring_text}"
-        else:
-            goal_main_text = f"{goal_count_text} {goal_scoring_text}\n\n{goal_assist_text}"
-            goal_main_discord = f"{goal_count_text} {goal_scoring_text}\n\n{goal_assist_text}"
 
-        if discordfmt:
-            return goal_main_discord
+        goal_main_text = goal_scoring_text
+        if goal_count_text is not None:
+            goal_main_text = f"{goal_count_text} {goal_main_text}"
+        if goal_assist_text is not None:
+            goal_main_text = f"{goal_main_text}\n\n{goal_assist_text}"
 
         return goal_main_text
 
     def generate_discord_embed(self):
-        """ Generates the custom Discord embed used for Goals. """
+        """Generates the custom Discord embed used for Goals.
+
+        Re-uses the goal_title_text & goal_main_text generated in __init__ (the Discord
+        formatted main text is currently identical to the social text).
+        """
 
         discord_embed = {
             "embeds": [
                 {
-                    "title": f"**{self.get_goal_title_text()}**",
-                    "description": self.get_goal_main_text(discordfmt=True),
+                    "title": f"**{self.goal_title_text}**",
+                    "description": self.goal_main_text,
                     "color": 13111342,
                     "timestamp": self.date_time,
                     "footer": {
@@ -1091,27 +1138,49 @@ class GoalEvent(GenericEvent):
             self.event_id,
             self.event_idx,
         )
-        players = data.get("players")
-        scorer = [x for x in players if x.get("playerType").lower() == "scorer"]
-        assist = [x for x in players if x.get("playerType").lower() == "assist"]
+
+        # A scoring change that failed to send is sent again before checking for any newer changes
+        if self.pending_scoring_change is not None:
+            return self.pending_scoring_change[1]
+
+        # If the players section hasn't changed since the last check, neither has the scoring
+        players_data = data.get("players")
+        if players_data == self.players_data:
+            return None
+
+        players = group_players_by_type(players_data)
+        scorer = players["scorer"]
+        assist = players["assist"]
+
+        # If the scorer isn't populated (partial feed), check again on the next loop
+        if not scorer:
+            logging.warning("Goal event %s is missing a scorer - checking again next loop.", self.event_id)
+            return None
 
         # Check for Changes in Player IDs
-        scorer_change = bool(scorer[0].get("player").get("id") != self.scorer_id)
-        assist_change = bool(assist != self.assists)
+        scorer_player = scorer[0].get("player")
+        scorer_change = bool(scorer_player.get("id") != self.scorer_id)
+        assist_ids = tuple(x.get("player").get("id") for x in assist)
+        assist_change = assist_ids != self.assist_ids
         if scorer_change or assist_change:
             logging.info("Scoring Change - %s / Assists Change - %s", scorer_change, assist_change)
 
+            # Fetch career stats before the totals are touched so re-parsing can't fail partway through
+            stats.get_career_stats_batch([scorer_player.get("id")] + list(assist_ids))
+
         if scorer_change:
-            print("Old Scorer -", self.scorer_name)
+            logging.info("Old Scorer - %s", self.scorer_name)
             goal_scorechange_title = "The scoring on this goal has changed."
             logging.info("Scoring change detected for event ID %s / IDX %s.", self.event_id, self.event_idx)
-            self.scorer_name = scorer[0].get("player").get("fullName")
-            self.scorer_id = scorer[0].get("player").get("id")
+            self.update_scoring_totals(-1)
+            self.scorer_name = scorer_player.get("fullName")
+            self.scorer_id = scorer_player.get("id")
             self.scorer_season_ttl = scorer[0].get("seasonTotal")
             logging.info("New Scorer - %s", self.scorer_name)
 
             # Re-parse assists too (a goal scoring change usually means assist changes too)
             self.parse_assists(assist=assist)
+            self.update_scoring_totals()
 
             if not assist:
                 goal_scorechange_text = (
@@ -1137,7 +1206,9 @@ class GoalEvent(GenericEvent):
             )
 
             # Re-parse assists too (a goal scoring change usually means assist changes too)
+            self.update_scoring_totals(-1)
             self.parse_assists(assist=assist)
+            self.update_scoring_totals()
             if self.num_assists == 1:
                 goal_scorechange_text = (
                     f"Give the lone assist on the {self.scorer_name} goal to "
@@ -1152,14 +1223,24 @@ class GoalEvent(GenericEvent):
             else:
                 goal_scorechange_text = f"The {self.scorer_name} goal is now unassisted!"
         else:
-            goal_scorechange_text = None
+            # Nothing to send, so the players section can be stored right away (see event_factory)
+            self.players_data = players_data
             return None
 
         # Return a string based on
         if goal_scorechange_title is None:
-            return goal_scorechange_text
+            scorechange_msg = goal_scorechange_text
         else:
-            return f"{goal_scorechange_title}\n\n{goal_scorechange_text}"
+            scorechange_msg = f"{goal_scorechange_title}\n\n{goal_scorechange_text}"
+
+        self.pending_scoring_change = (players_data, scorechange_msg)
+        return scorechange_msg
+
+    def scoring_change_sent(self):
+        """Marks the pending scoring change as sent & only now stores its players section
+        (so a failed send is retried on the next loop instead of short-circuiting)."""
+        self.players_data = self.pending_scoring_change[0]
+        self.pending_scoring_change = None
 
     def milestone_tweet_sender(self, player_name, pointassist, number):
         """ A function that generates / sends tweet if a player has hit some type of milestone. """
@@ -1171,11 +1252,13 @@ class GoalEvent(GenericEvent):
             social_ids = socialhandler.send(tweet_msg, reply=self.tweet, force_send=True, game_hashtag=True)
             self.tweet = social_ids.get("twitter")
 
-    def was_goal_removed(self, all_plays: dict):
-        """ This function checks if the goal was removed from the livefeed (usually for a Challenge). """
-        goal_still_exists = next(
-            (play for play in all_plays if play["about"]["eventId"] == self.event_id), None
-        )
+    def was_goal_removed(self, all_plays_by_id: dict):
+        """This function checks if the goal was removed from the livefeed (usually for a Challenge).
+
+        Args:
+            all_plays_by_id: Dictionary of all plays in the livefeed keyed by eventId
+        """
+        goal_still_exists = all_plays_by_id.get(self.event_id)
 
         # If the goal doesn't exist, check the event removal counter & then delete the event
         if not goal_still_exists and self.event_removal_counter < 5:
@@ -1210,22 +1293,21 @@ class ShotEvent(GenericEvent):
         self.event_team = data.get("team").get("name")
 
         # Mark Shots as Corsi or Fenwick
-        corsi_events = ["MISSED_SHOT", "BLOCKED_SHOT", "SHOT"]
-        fenwick_events = ["MISSED_SHOT", "SHOT"]
-        self.corsi = True if self.event_type in corsi_events else False
-        self.fenwick = True if self.event_type in fenwick_events else False
+        self.corsi = self.event_type in _CORSI_EVENTS
+        self.fenwick = self.event_type in _FENWICK_EVENTS
 
         # Get the Players Section
-        players = data.get("players")
-        player = [x for x in players if x.get("playerType").lower() == "shooter"]
-        goalie = [x for x in players if x.get("playerType").lower() == "goalie"]
-        self.player_name = player[0].get("player").get("fullName")
-        self.player_id = player[0].get("player").get("id")
+        players = group_players_by_type(data.get("players"))
+        goalie = players["goalie"]
+        shooter_player = players["shooter"][0].get("player")
+        self.player_name = shooter_player.get("fullName")
+        self.player_id = shooter_player.get("id")
 
         # Missed Shots & Blocked Shots don't have goalie attributes
         if goalie:
-            self.goalie_name = goalie[0].get("player").get("fullName")
-            self.goalie_id = goalie[0].get("player").get("id")
+            goalie_player = goalie[0].get("player")
+            self.goalie_name = goalie_player.get("fullName")
+            self.goalie_id = goalie_player.get("id")
         else:
             self.goalie_name = None
             self.goalie_id = None
@@ -1236,6 +1318,10 @@ class ShotEvent(GenericEvent):
         self.y = coordinates.get("y", 0.0)
         self.shot_distance = utils.calculate_shot_distance(self.x, self.y)
 
+        # Check (once) if the shot hit the crossbar or the post (only preferred team shots are sent)
+        preferred_shot = bool(self.event_team == self.game.preferred_team.team_name)
+        self.shot_hit = get_shot_hit(self.description) if preferred_shot else None
+
         # Now call any functions that should be called when creating a new object
         # (FOR NOW) we only checked for missed shots that hit the post.
         if self.crossbar_or_post():
@@ -1251,8 +1337,7 @@ class ShotEvent(GenericEvent):
             return False
 
         # Check to see if the post hit the crossbar or the goal post
-        hit_keywords = ["crossbar", "goalpost"]
-        if any(x in self.description.lower() for x in hit_keywords):
+        if self.shot_hit:
             logging.info("The preferred team hit a post or crossbar - social media message.")
             return True
         else:
@@ -1261,15 +1346,8 @@ class ShotEvent(GenericEvent):
 
     def generate_social_msg(self):
         """ Used for generating the message that will be logged or sent to social media. """
-        if "crossbar" in self.description.lower():
-            shot_hit = "crossbar"
-        elif "goalpost" in self.description.lower():
-            shot_hit = "post"
-        else:
-            shot_hit = None
-
         self.social_msg = (
-            f"DING! 🛎\n\n{self.player_name} hits the {shot_hit} from {self.shot_distance} "
+            f"DING! 🛎\n\n{self.player_name} hits the {self.shot_hit} from {self.shot_distance} "
             f"away with {self.period_time_remain} remaining in the {self.period_ordinal} period."
         )
 
@@ -1305,33 +1383,32 @@ class PenaltyEvent(GenericEvent):
             self.penalty_team_obj = self.game.other_team
             self.powerplay_team_obj = self.game.preferred_team
 
-        # Setup the Penalty Situation Object
-        penalty_situation = self.game.penalty_situation
-        penalty_situation.new_penalty(
-            penalty_ss=self.period_time_remain_ss,
-            penalty_length=self.penalty_length_ss,
-            pp_team=self.powerplay_team_obj,
-        )
-
         # Get the Players Section
-        players = data.get("players")
-        drew_by = [x for x in players if x.get("playerType").lower() == "drewby"]
-        penalty_on = [x for x in players if x.get("playerType").lower() == "penaltyon"]
-        served_by = [x for x in players if x.get("playerType").lower() == "servedby"]
+        players = group_players_by_type(data.get("players"))
+        drew_by = players["drewby"]
+        penalty_on = players["penaltyon"]
+        served_by = players["servedby"]
 
         # If penalty is a bench minor & served_by is empty, try again next loop
         if self.severity == "bench minor" and not served_by:
             raise ValueError("A bench-minor penalty should have a servedBy player.")
 
-        # Sometimes the drew_by fields are not populated immediately
-        self.drew_by_name = drew_by[0].get("player").get("fullName") if drew_by else None
-        self.drew_by_id = drew_by[0].get("player").get("id") if drew_by else None
-        self.served_by_name = served_by[0].get("player").get("fullName") if served_by else None
-        self.served_by_id = served_by[0].get("player").get("id") if served_by else None
+        # If the penalty_on field isn't populated yet, try again next loop
+        if not penalty_on:
+            raise ValueError("A penalty should have a penaltyOn player - skip & try again.")
 
-        self.penalty_on_name = penalty_on[0].get("player").get("fullName")
-        self.penalty_on_id = penalty_on[0].get("player").get("id")
-        self.penalty_on_game_ttl = game_event_total(PenaltyEvent, self.penalty_on_name, "penalty_on_name") + 1
+        # Sometimes the drew_by fields are not populated immediately
+        drew_by_player = drew_by[0].get("player") if drew_by else {}
+        served_by_player = served_by[0].get("player") if served_by else {}
+        penalty_on_player = penalty_on[0].get("player")
+        self.drew_by_name = drew_by_player.get("fullName")
+        self.drew_by_id = drew_by_player.get("id")
+        self.served_by_name = served_by_player.get("fullName")
+        self.served_by_id = served_by_player.get("id")
+
+        self.penalty_on_name = penalty_on_player.get("fullName")
+        self.penalty_on_id = penalty_on_player.get("id")
+        self.penalty_on_game_ttl = self.game.penalty_totals[self.penalty_on_name] + 1
 
         # Penalty Shot Fixes
         if self.minutes == 0 and not self.drew_by_name:
@@ -1344,17 +1421,22 @@ class PenaltyEvent(GenericEvent):
         else:
             self.penalty_shot = False
 
+        # Setup the Penalty Situation Object (after all skip & try again checks so it's only added once)
+        penalty_situation = self.game.penalty_situation
+        penalty_situation.new_penalty(
+            penalty_ss=self.period_time_remain_ss,
+            penalty_length=self.penalty_length_ss,
+            pp_team=self.powerplay_team_obj,
+        )
+
         # Get the Coordinates Section
         coordinates = data.get("coordinates")
         self.x = coordinates.get("x", 0.0)
         self.y = coordinates.get("y", 0.0)
 
         # Determine the Penalty Zone
-        pref_team = self.game.preferred_team
-        other_team = self.game.other_team
-        penalty_team_obj = pref_team if pref_team.team_name == self.penalty_team else other_team
         penalty_zone_info = utils.determine_event_zone(
-            self.x, self.y, self.period, penalty_team_obj.home_away
+            self.x, self.y, self.period, self.penalty_team_obj.home_away
         )
         penalty_zone = penalty_zone_info[1]
         self.penalty_zone_text = f" in the {penalty_zone} zone" if penalty_zone else ""
@@ -1366,26 +1448,19 @@ class PenaltyEvent(GenericEvent):
         self.generate_social_msg(self.penalty_shot)
         ids = socialhandler.send(msg=self.social_msg, event=self, game_hashtag=True)
 
+        # Only count this penalty once it has been fully created (failed penalties are retried)
+        self.game.penalty_totals[self.penalty_on_name] += 1
+
     def penalty_type_fixer(self, original_type):
         """ A function that converts some poorly named penalty types. """
-        secondarty_types = {
-            "delaying game - puck over glass": "delay of game (puck over glass)",
-            "interference - goalkeeper": "goalie interference",
-            "missing key [pd_151]": "delay of game (unsuccessful challenge)",
-            "hi-sticking": "high sticking",
-        }
-        return secondarty_types.get(original_type, original_type)
+        return _PENALTY_TYPE_FIXES.get(original_type, original_type)
 
     def get_skaters(self):
         """ Used for determining how many skaters were on the ice at the time of event. """
 
-        # Get penalty team & skater attributes / numbers
-        if self.penalty_team == self.game.home_team.team_name:
-            self.penalty_on_team = self.game.home_team
-            self.penalty_draw_team = self.game.away_team
-        else:
-            self.penalty_on_team = self.game.away_team
-            self.penalty_draw_team = self.game.home_team
+        # Get penalty team & skater attributes / numbers (teams were already matched in __init__)
+        self.penalty_on_team = self.penalty_team_obj
+        self.penalty_draw_team = self.powerplay_team_obj
 
         power_play_strength = self.game.power_play_strength
         penalty_on_skaters = self.penalty_on_team.skaters
@@ -1403,74 +1478,49 @@ class PenaltyEvent(GenericEvent):
         )
 
         # TODO: Get periodTimeRemaining for some of these strings
-        if power_play_strength == "Even" and penalty_on_skaters == penalty_draw_skaters == 4:
-            penalty_text_skaters = "Teams will skate 4 on 4."
-        elif power_play_strength == "Even" and penalty_on_skaters == penalty_draw_skaters == 3:
-            penalty_text_skaters = "Teams will skate 3 on 3."
-        elif power_play_strength != "Even":
-            # Preferred Team Advantages
-            if pref_skaters == 5 and other_skaters == 4:
-                penalty_text_skaters = f"{pref_short_name} are headed to the power play!"
-            elif pref_skaters == 5 and other_skaters == 3:
-                penalty_text_skaters = f"{pref_short_name} will have a two-man advantage!"
-            elif pref_skaters == 4 and other_skaters == 3:
-                penalty_text_skaters = f"{pref_short_name} are headed a 4-on-3 power play!"
-
-            # Other Team Advantages
-            elif pref_skaters == 4 and other_skaters == 5:
-                penalty_text_skaters = f"{pref_short_name} are headed to the penalty kill!"
-            elif pref_skaters == 3 and other_skaters == 5:
-                penalty_text_skaters = f"{pref_short_name} will have to kill off a two-man advantage!"
-            elif pref_skaters == 3 and other_skaters == 5:
-                penalty_text_skaters = f"{pref_short_name} will have a 4-on-3 penalty to kill!"
-        else:
+        strength = "Even" if power_play_strength == "Even" else "PP"
+        penalty_text_skaters = _PENALTY_SKATERS_TEXT.get((strength, pref_skaters, other_skaters))
+        if penalty_text_skaters is None:
             logging.info("Unkown penalty skater combination")
             penalty_text_skaters = ""
+        else:
+            penalty_text_skaters = penalty_text_skaters.format(pref_short_name=pref_short_name)
+
+        # The start & end of the penalty text is shared by all penalty types
+        penalty_text_start = f"{self.penalty_on_name} takes a {self.minutes}-minute {self.severity} penalty"
+        penalty_text_end = (
+            f"{self.period_time_remain} remaining in the {self.period_ordinal} period. "
+            # f"That's his {utils.ordinal(self.penalty_on_game_ttl)} penalty of the game. "
+            f"{penalty_text_skaters}"
+        )
 
         if self.served_by_name is not None:
             penalty_text_players = (
-                f"{self.penalty_on_name} takes a {self.minutes}-minute {self.severity} "
-                f"penalty for {self.secondary_type} (served by {self.served_by_name}) with "
-                f"{self.period_time_remain} remaining in the {self.period_ordinal} period. "
-                # f"That's his {utils.ordinal(self.penalty_on_game_ttl)} penalty of the game. "
-                f"{penalty_text_skaters}"
+                f"{penalty_text_start} for {self.secondary_type} (served by {self.served_by_name}) with "
+                f"{penalty_text_end}"
             )
         elif self.severity == "game misconduct":
             penalty_text_players = (
-                f"{self.penalty_on_name} takes a {self.minutes}-minute {self.severity} "
-                f"penalty and won't return to the game. The penalty occurred with "
-                f"{self.period_time_remain} remaining in the {self.period_ordinal} period. "
-                # f"That's his {utils.ordinal(self.penalty_on_game_ttl)} penalty of the game. "
-                f"{penalty_text_skaters}"
+                f"{penalty_text_start} and won't return to the game. The penalty occurred with "
+                f"{penalty_text_end}"
             )
         else:
             penalty_text_players = (
-                f"{self.penalty_on_name} takes a {self.minutes}-minute {self.severity} penalty"
-                f"{self.penalty_zone_text} for {self.secondary_type} and heads to the "
-                f"penalty box with {self.period_time_remain} remaining in the {self.period_ordinal} period. "
-                # f"That's his {utils.ordinal(self.penalty_on_game_ttl)} penalty of the game. "
-                f"{penalty_text_skaters}"
+                f"{penalty_text_start}{self.penalty_zone_text} for {self.secondary_type} and heads to the "
+                f"penalty box with {penalty_text_end}"
             )
 
         return penalty_text_players
 
     def get_penalty_stats(self):
         """ Used for determining penalty kill / power play stats. """
-        penalty_on_stats = self.penalty_on_team.get_stat_and_rank("penaltyKillPercentage")
-        penalty_on_short_name = self.penalty_on_team.short_name
-        penalty_on_stat = penalty_on_stats[0]
-        penalty_on_rank = penalty_on_stats[1]
-        penalty_on_rankstat_text = f"{penalty_on_short_name} PK: {penalty_on_stat}% ({penalty_on_rank})"
-
-        penalty_draw_stats = self.penalty_draw_team.get_stat_and_rank("powerPlayPercentage")
-        penalty_draw_short_name = self.penalty_draw_team.short_name
-        penalty_draw_stat = penalty_draw_stats[0]
-        penalty_draw_rank = penalty_draw_stats[1]
-        penalty_draw_rankstat_text = (
-            f"{penalty_draw_short_name} PP: {penalty_draw_stat}% ({penalty_draw_rank})"
-        )
+        penalty_on_stat, penalty_on_rank = self.penalty_on_team.get_stat_and_rank("penaltyKillPercentage")
+        penalty_draw_stat, penalty_draw_rank = self.penalty_draw_team.get_stat_and_rank("powerPlayPercentage")
 
-        penalty_rankstat_text = f"{penalty_on_rankstat_text}\n{penalty_draw_rankstat_text}"
+        penalty_rankstat_text = (
+            f"{self.penalty_on_team.short_name} PK: {penalty_on_stat}% ({penalty_on_rank})\n"
+            f"{self.penalty_draw_team.short_name} PP: {penalty_draw_stat}% ({penalty_draw_rank})"
+        )
         return penalty_rankstat_text
 
     def generate_social_msg(self, penaltyshot=False):
@@ -1507,14 +1557,7 @@ class ShootoutEvent(GenericEvent):
         super().__init__(data, game)
 
         # Check if the event is actual shootout event
-        non_shootout_events = [
-            "PERIOD_START",
-            "SHOOTOUT_COMPLETE",
-            "PERIOD_END",
-            "PERIOD_OFFICIAL",
-            "GAME_OFFICIAL",
-        ]
-        if self.event_type in non_shootout_events:
+        if self.event_type in _NON_SHOOTOUT_EVENTS:
             logging.info(
                 "A non-tracking shootout event (%s) detected - just return & skip this.", self.event_type
             )
@@ -1526,28 +1569,31 @@ class ShootoutEvent(GenericEvent):
             self.game.shootout.last_tweet = social_ids.get("twitter")
             return
 
-        # Grab the event team from the Results section
-        results = data.get("result")
+        # Grab the event team from the Team section
         self.event_team = data.get("team").get("name")
 
         # Get the Players Section
-        players = data.get("players")
-        shooter = [x for x in players if x.get("playerType").lower() in ("scorer", "shooter")]
-        goalie = [x for x in players if x.get("playerType").lower() == "goalie"]
+        players = group_players_by_type(data.get("players"))
+        shooter = players["scorer"] or players["shooter"]
+        goalie = players["goalie"]
 
         # Handle Scorer name, id & totals
-        self.shooter_name = shooter[0].get("player").get("fullName")
-        self.shooter_id = shooter[0].get("player").get("id")
-        self.goalie_name = goalie[0].get("player").get("fullName") if goalie else None
-        self.goalie_id = goalie[0].get("player").get("id") if goalie else None
+        shooter_player = shooter[0].get("player")
+        goalie_player = goalie[0].get("player") if goalie else {}
+        self.shooter_name = shooter_player.get("fullName")
+        self.shooter_id = shooter_player.get("id")
+        self.goalie_name = goalie_player.get("fullName")
+        self.goalie_id = goalie_player.get("id")
 
         shootout_tracking_emoji = "✅" if self.event_type == "GOAL" else "❌"
         logging.info("Shootout event (%s) detected for %s.", self.event_type, self.event_team)
 
+        # Goals & saved shots can't hit the crossbar or post, so only scan the description for misses
+        hit_crossbar_post = self.crossbar_or_post() if self.event_type not in ("GOAL", "SHOT") else False
+
         # Preferred Team Shoots
         if self.event_team == game.preferred_team.team_name:
             game.shootout.preferred_score.append(shootout_tracking_emoji)
-            hit_crossbar_post = self.crossbar_or_post()
             if self.event_type == "GOAL":
                 self.shootout_event_text = f"{self.shooter_name} shoots & scores! 🚨"
             elif self.event_type == "SHOT":
@@ -1561,7 +1607,6 @@ class ShootoutEvent(GenericEvent):
         # Other Team Shoots
         if self.event_team == game.other_team.team_name:
             game.shootout.other_score.append(shootout_tracking_emoji)
-            hit_crossbar_post = self.crossbar_or_post()
             if self.event_type == "GOAL":
                 self.shootout_event_text = f"{self.shooter_name} shoots & scores. 👎🏻"
             elif self.event_type == "SHOT":
@@ -1581,18 +1626,7 @@ class ShootoutEvent(GenericEvent):
 
     def crossbar_or_post(self):
         """ Checks shot text to determine if the shootout shot hit the crossbar or post. """
-        hit_keywords = ["crossbar", "goalpost"]
-
-        # If any of the hit keywords appear in the description of the event
-        if any(x in self.description.lower() for x in hit_keywords):
-            if "crossbar" in self.description.lower():
-                return "crossbar"
-            elif "goalpost" in self.description.lower():
-                return "post"
-            else:
-                return False
-        else:
-            return False
+        return get_shot_hit(self.description) or False
 
     def generate_social_msg(self):
         shootout_preferred_score = " - ".join(self.game.shootout.preferred_score)
@@ -29,38 +29,42 @@ def get_content_feed(game_id, milestones=False):
     return response
 
 
-def search_milestones_for_id(milestones, event_id):
-    """Searches the milestones list for an item that matches the statsEventID passed in.
+def index_milestones(milestones):
+    """Builds a lookup of milestones by their statsEventId keyword so each event can
+        be found with a single dictionary lookup instead of scanning every milestone.
 
     Args:
-        event_id (int): NHL Game Event ID
+        milestones (list): The milestones section of the content feed
 
     Returns:
-        event_exists (bool): Does the event exist
-        highlight (dict): Dictionary of the highlight itself
-        nhl_video_url (string): URL pointing to the NHL Video Highlight of the event
+        milestones_by_id (dict): Dictionary of milestone items keyed by statsEventId (str)
     """
-    # If mile
-    if not milestones:
-        return False, None, None
+    milestones_by_id = {}
+    for item in milestones or []:
+        for keyword in item["keywords"]:
+            if keyword.get("type") == "statsEventId" and keyword.get("value") == keyword.get("displayName"):
+                milestones_by_id.setdefault(keyword["value"], item)
+
+    return milestones_by_id
 
-    str_event_id = str(event_id)
-    stats_event_dict = {"type": "statsEventId", "value": str_event_id, "displayName": str_event_id}
 
-    # Iterate over "Milestones" & Check for Our Event ID
-    # When Found, Break out of the Loop & Continue Processing
-    event = None
+def search_milestones_for_id(milestones_by_id, event_id):
+    """Searches the indexed milestones for an item that matches the statsEventID passed in.
 
-    for i in milestones:
-        has_our_event = [x for x in i["keywords"] if x == stats_event_dict]
-        if has_our_event:
-            event = i
-            break
+    Args:
+        milestones_by_id (dict): Milestones indexed by statsEventId (via index_milestones)
+        event_id (int): NHL Game Event ID
 
-    # event = next(filter(lambda obj: obj.get("statsEventId") == str(event_id), milestones), None)
+    Returns:
+        event_exists (bool): Does the event exist
+        highlight (dict): Dictionary of the highlight itself
+        nhl_video_url (string): URL pointing to the NHL Video Highlight of the event
+        nhl_mp4_url (string): URL pointing to the MP4 of the NHL Video Highlight
+    """
+    event = milestones_by_id.get(str(event_id)) if milestones_by_id else None
 
     if not event:
-        return False, None, None
+        return False, None, None, None
 
     try:
         # highlight = event.get("highlight")
@@ -72,7 +76,7 @@ def search_milestones_for_id(milestones, event_id):
                 "The highlight for %s exists, but there is no Video ID - try again next loop.",
                 event_id,
             )
-            return False, None, None
+            return False, None, None, None
 
         nhl_video_url = f"https://www.nhl.com/video/c-{video_id}?tcid=tw_video_content_id"
 
@@ -81,7 +85,7 @@ def search_milestones_for_id(milestones, event_id):
         return True, highlight, nhl_video_url, nhl_mp4_url
     except AttributeError:
         logging.error("Error getting video ID and / or NHL Video URL.")
-        return False, None, None
+        return False, None, None, None
 
 
 def get_game_recap(content_feed):
@@ -2,7 +2,10 @@
 This module contains the any stats related functions from the NHL API for players or teams.
 """
 
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 
 import pandas as pd
@@ -13,8 +16,10 @@ from hockeygamebot.helpers import utils
 urls = utils.load_urls()
 
 
+@functools.lru_cache(maxsize=2048)
 def get_player_career_stats(player_id):
     """Returns the career stats of an NHL player by their given player ID.
+        Results are cached since career stats don't change during a game (one game per run).
 
     Args:
         player_id: A 7-digit NHL player id.
@@ -36,6 +41,23 @@ def get_player_career_stats(player_id):
         return {"assists": 0, "points": 0, "goals": 0}
 
 
+def get_career_stats_batch(player_ids):
+    """Fetches (and caches) the career stats of multiple NHL players concurrently so a goal
+        with a scorer & two assists doesn't have to wait on three sequential requests.
+
+    Args:
+        player_ids: A list of 7-digit NHL player ids.
+
+    Returns:
+        career_stats: A dictionary of career stats dictionaries keyed by player ID
+    """
+    if not player_ids:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        return dict(zip(player_ids, executor.map(get_player_career_stats, player_ids)))
+
+
 def get_goalie_career_stats(player_id):
     """The NHL API doesn't contain points stats for goalie, use Natural Stat Trick for stat retrieval."""
 
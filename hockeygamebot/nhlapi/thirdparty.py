@@ -536,7 +536,7 @@ def scouting_the_refs(game, pref_team):
             ref_dict["careergames"] = ref_career_games
             ref_dict["penaltygame"] = ref_penalty_game
             ref_dict["totalgames"] = calculate_total_games(ref_dict)
-            print(ref_dict)
+            logging.debug("Referee: %s", ref_dict)
             return_referees.append(ref_dict)
 
     linesmen = game_details.find_all("tr")[idx_line_names].find_all("td")
@@ -552,7 +552,7 @@ def scouting_the_refs(game, pref_team):
             linesman_dict["seasongames"] = linesman_season_games
             linesman_dict["careergames"] = linesman_career_games
             linesman_dict["totalgames"] = calculate_total_games(linesman_dict)
-            print(linesman_dict)
+            logging.debug("Linesman: %s", linesman_dict)
             return_linesmen.append(linesman_dict)
 
     return_dict["referees"] = return_referees
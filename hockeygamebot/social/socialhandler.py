@@ -12,6 +12,11 @@ from hockeygamebot.models.globalgame import GlobalGame
 from hockeygamebot.social import discord, slack, twitter
 
 
+def discord_enabled():
+    """ Returns True if Discord is enabled in the socials section of the config. """
+    return bool(config.socials["discord"])
+
+
 @utils.check_social_timeout
 def send(msg, **kwargs):
     """The handler function that takes a message and a set of key-value arguments
@@ -116,7 +116,7 @@ def send_tweet(
             wait = processing_info.get("check_after_secs", 1)
 
             if state == "pending" or state == "in_progress":
-                logging.info(f"Upload not done - waiting %s seconds.", wait)
+                logging.info("Upload not done - waiting %s seconds.", wait)
                 time.sleep(wait)
 
             logging.info("Upload completed - sending tweet now.")